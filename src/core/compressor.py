@@ -1,6 +1,13 @@
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 
+# Upper bound on decoded image size (pixels). The header is read before
+# any pixel data, so oversized inputs are rejected with a clear message
+# instead of ballooning RSS by H*W*4 bytes mid-batch.
+MAX_IMAGE_PIXELS = 128_000_000
+
 
 def compress_image(input_path, output_path, quality=85, remove_metadata=False):
     """
@@ -16,11 +23,22 @@ def compress_image(input_path, output_path, quality=85, remove_metadata=False):
         tuple: (success: bool, message: str, file_size_reduction: float)
     """
     try:
-        # Open the image
+        # Fast bypass: at quality 100 with metadata kept the output format
+        # equals the source, and re-encoding only burns CPU (and usually
+        # grows the file) — link or copy the original bytes instead
+        if quality >= 100 and not remove_metadata:
+            return _copy_original(input_path, output_path)
+
+        # Open the image — Image.open reads only the header; pixels are
+        # decoded lazily, so the size check below is nearly free
         img = Image.open(input_path)
 
+        width, height = img.size
+        if width * height > MAX_IMAGE_PIXELS:
+            return False, f"Error: Image too large ({width}x{height}, limit {MAX_IMAGE_PIXELS} pixels)", 0.0
+
         # Get original file size
-        original_size = os.path.getsize(input_path)
+        original_size = os.stat(input_path).st_size
 
         # Get original format
         original_format = img.format
@@ -32,26 +50,33 @@ def compress_image(input_path, output_path, quality=85, remove_metadata=False):
         }
 
         # Handle metadata
-        if remove_metadata:
-            # Save without EXIF data
-            # Convert RGBA to RGB if saving as JPEG
-            if original_format == 'JPEG' and img.mode == 'RGBA':
-                img = img.convert('RGB')
-            img.save(output_path, format=original_format, **save_kwargs)
-        else:
-            # Preserve EXIF data
-            exif_data = img.getexif()
-            if exif_data:
-                save_kwargs['exif'] = exif_data
-
-            # Convert RGBA to RGB if saving as JPEG
-            if original_format == 'JPEG' and img.mode == 'RGBA':
-                img = img.convert('RGB')
-
-            img.save(output_path, format=original_format, **save_kwargs)
-
-        # Get compressed file size
-        compressed_size = os.path.getsize(output_path)
+        if not remove_metadata:
+            # Preserve EXIF data — pass the raw APP1 bytes through unchanged.
+            # Building an Exif object via getexif() re-parses the segment and
+            # re-serializes it on save, which is pure overhead here.
+            raw_exif = img.info.get('exif')
+            if raw_exif:
+                save_kwargs['exif'] = raw_exif
+
+        # Convert RGBA to RGB if saving as JPEG
+        if original_format == 'JPEG' and img.mode == 'RGBA':
+            img = img.convert('RGB')
+
+        # Save through a 1 MiB buffered writer so encoder output goes to
+        # disk in large blocks; tell() doubles as the compressed size,
+        # saving a stat syscall
+        try:
+            with open(output_path, 'wb', buffering=1 << 20) as fp:
+                img.save(fp, format=original_format, **save_kwargs)
+                compressed_size = fp.tell()
+        except Exception:
+            # The open() already created (or truncated) the output —
+            # remove it so a failed encode doesn't leave a 0-byte file
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
 
         # Calculate size reduction percentage
         size_reduction = ((original_size - compressed_size) / original_size) * 100
@@ -67,6 +92,89 @@ def compress_image(input_path, output_path, quality=85, remove_metadata=False):
         return False, f"Error: {str(e)}", 0.0
 
 
+def _copy_original(input_path, output_path):
+    """
+    Copy an image to the output path without re-encoding.
+
+    Always a real byte copy — a hardlink would make the output share an
+    inode with the user's source image, so any later in-place overwrite
+    of the output (e.g. re-running the batch at a lower quality with the
+    'replace' strategy) would truncate the original photo.
+
+    Returns:
+        tuple: (success: bool, message: str, file_size_reduction: float)
+    """
+    in_key = os.path.normcase(os.path.abspath(input_path))
+    out_key = os.path.normcase(os.path.abspath(output_path))
+
+    if in_key != out_key:
+        shutil.copyfile(input_path, output_path)
+
+    original_mb = os.stat(input_path).st_size / (1024 * 1024)
+    message = f"Copied: {original_mb:.2f} MB (quality 100, no re-encode)"
+    return True, message, 0.0
+
+
+def _compress_one(args):
+    """
+    Process-pool entry point for compress_batch.
+
+    Must stay module-level so it is picklable by multiprocessing.
+
+    Args:
+        args: Tuple of (input_path, output_path, quality, remove_metadata)
+
+    Returns:
+        tuple: (input_path, success, message, size_reduction)
+    """
+    input_path, output_path, quality, remove_metadata = args
+    success, message, reduction = compress_image(input_path, output_path, quality, remove_metadata)
+    return input_path, success, message, reduction
+
+
+def compress_batch(jobs, quality=85, remove_metadata=False, max_workers=None,
+                   should_cancel=None):
+    """
+    Compress a batch of images in parallel across CPU cores.
+
+    Image encoding is CPU-bound, so spreading a batch over a process pool
+    scales roughly linearly with core count. Jobs are submitted as
+    individual futures so a cancellation can revoke everything still
+    queued — executor.map would run every submitted job to completion
+    during pool teardown even after the consumer stops iterating.
+
+    Args:
+        jobs: List of (input_path, output_path) tuples
+        quality: Compression quality (1-100, higher is better)
+        remove_metadata: Whether to remove EXIF metadata
+        max_workers: Pool size (defaults to os.cpu_count())
+        should_cancel: Optional callable checked between results; when it
+            returns True, pending jobs are cancelled and iteration stops
+
+    Yields:
+        tuple: (input_path, success, message, size_reduction) in job order
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    args = [(input_path, output_path, quality, remove_metadata)
+            for input_path, output_path in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_compress_one, a) for a in args]
+        try:
+            for future in futures:
+                if should_cancel is not None and should_cancel():
+                    break
+                yield future.result()
+        finally:
+            # Runs on cancellation and when the consumer abandons the
+            # generator — revoke queued jobs so the pool exit only waits
+            # for the ones already executing
+            for future in futures:
+                future.cancel()
+
+
 def validate_quality(quality):
     """
     Validate and clamp quality value to acceptable range.
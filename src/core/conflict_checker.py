@@ -6,7 +6,21 @@ about conflicts for user resolution.
 """
 
 import os
-from datetime import datetime
+import time
+
+# Target extension per output format; None keeps the input filename.
+# Unknown formats fall back to the input filename as well.
+_TARGET_EXTS = {
+    'Keep Original': None,
+    'WebP': '.webp',
+    'AVIF': '.avif',
+}
+
+# Size thresholds, largest first (powers of two precomputed once)
+_UNITS = [(1 << 30, 'GB'), (1 << 20, 'MB'), (1 << 10, 'KB')]
+
+# Modification-date display format
+_DATE_FMT = "%b %d, %Y %H:%M"
 
 
 def check_conflicts(image_paths, output_folder, output_format):
@@ -27,32 +41,38 @@ def check_conflicts(image_paths, output_folder, output_format):
     """
     conflicts = []
 
+    # Snapshot the destination directory once so each input needs only an
+    # O(1) set lookup instead of a per-file stat syscall. Names are
+    # lowercased because Windows filenames are case-insensitive.
+    try:
+        with os.scandir(output_folder) as entries:
+            existing_names = frozenset(entry.name.lower() for entry in entries)
+    except OSError:
+        existing_names = frozenset()
+
+    # Hoist the format decision out of the loop
+    target_ext = _TARGET_EXTS.get(output_format)
+
     for input_path in image_paths:
         # Generate output filename based on format
         input_basename = os.path.basename(input_path)
 
-        if output_format == "Keep Original":
+        if target_ext is None:
             # Keep same filename
             output_filename = input_basename
-        elif output_format == "WebP":
-            # Change extension to .webp
-            base_name = os.path.splitext(input_basename)[0]
-            output_filename = f"{base_name}.webp"
-        elif output_format == "AVIF":
-            # Change extension to .avif
-            base_name = os.path.splitext(input_basename)[0]
-            output_filename = f"{base_name}.avif"
         else:
-            # Unknown format, keep original
-            output_filename = input_basename
-
-        output_path = os.path.join(output_folder, output_filename)
-
-        # Check if file exists
-        if os.path.exists(output_path):
+            # Swap the extension without a splitext call per file
+            dot = input_basename.rfind('.')
+            stem = input_basename[:dot] if dot > 0 else input_basename
+            output_filename = stem + target_ext
+
+        # Check if file exists — stat only when a conflict is detected
+        if output_filename.lower() in existing_names:
+            output_path = os.path.join(output_folder, output_filename)
             try:
-                existing_size = os.path.getsize(output_path)
-                existing_modified = os.path.getmtime(output_path)
+                stat_result = os.stat(output_path)
+                existing_size = stat_result.st_size
+                existing_modified = stat_result.st_mtime
             except Exception:
                 # If we can't get file info, skip
                 existing_size = 0
@@ -79,14 +99,10 @@ def format_file_size(size_bytes):
     Returns:
         Formatted size string (e.g., "2.4 MB")
     """
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    for threshold, unit in _UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / threshold:.1f} {unit}"
+    return f"{size_bytes} B"
 
 
 def format_modified_date(timestamp):
@@ -99,8 +115,12 @@ def format_modified_date(timestamp):
     Returns:
         Formatted date string (e.g., "Jan 12, 2026 14:30")
     """
+    if timestamp is None:
+        # localtime(None) would silently mean "now"
+        return "Unknown"
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        return dt.strftime("%b %d, %Y %H:%M")
-    except Exception:
+        # time.localtime + strftime skips the datetime object and tzinfo
+        # allocations of datetime.fromtimestamp().strftime()
+        return time.strftime(_DATE_FMT, time.localtime(timestamp))
+    except (OSError, OverflowError, ValueError, TypeError):
         return "Unknown"
@@ -1,7 +1,7 @@
 import os
 from PyQt6.QtCore import QThread, pyqtSignal
-from core.compressor import compress_image, validate_quality
-from core.converter import convert_image
+from core.compressor import compress_batch, validate_quality
+from core.converter import convert_batch
 
 
 class ImageProcessorWorker(QThread):
@@ -16,7 +16,8 @@ class ImageProcessorWorker(QThread):
     file_completed = pyqtSignal(bool, str, str, dict)  # (success, filename, message, stats)
     all_completed = pyqtSignal(int, int, list)  # (successful, failed, errors)
 
-    def __init__(self, images, output_folder, quality, remove_metadata, output_format, conflict_strategy='replace'):
+    def __init__(self, images, output_folder, quality, remove_metadata, output_format,
+                 conflict_strategy='replace', method=4):
         """
         Initialize the worker thread.
 
@@ -27,6 +28,7 @@ class ImageProcessorWorker(QThread):
             remove_metadata: Whether to remove EXIF metadata
             output_format: Output format ('Keep Original', 'WebP', 'AVIF')
             conflict_strategy: How to handle existing files ('replace', 'skip', 'auto_rename')
+            method: Encoder effort for conversions (4 = fast, 6 = extra compression)
         """
         super().__init__()
         self.images = images
@@ -35,72 +37,99 @@ class ImageProcessorWorker(QThread):
         self.remove_metadata = remove_metadata
         self.output_format = output_format
         self.conflict_strategy = conflict_strategy
+        self.method = method
         self.is_cancelled = False
 
     def run(self):
         """
         Execute the image processing in the background thread.
+
+        Output paths are resolved up front so the whole batch can be
+        submitted to a process pool, spreading the CPU-bound encoding
+        work across all cores instead of serializing on one.
         """
         total_images = len(self.images)
         successful = 0
         failed = 0
         errors = []
-
-        for idx, input_path in enumerate(self.images):
-            # Check if processing was cancelled
-            if self.is_cancelled:
-                break
-
-            # Get filename
+        processed = 0
+
+        # Names already claimed in the output folder — one scandir snapshot
+        # plus every name assigned below. Probing the directory per file
+        # would miss names handed out earlier in this loop, so two inputs
+        # with the same basename would resolve to the same "unique" path
+        # and the pool would write both to it concurrently.
+        try:
+            with os.scandir(self.output_folder) as entries:
+                self._taken_names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            self._taken_names = set()
+
+        # Resolve output paths (and conflicts) before submitting the batch
+        jobs = []
+        for input_path in self.images:
             file_name = os.path.basename(input_path)
-
-            # Emit signal that we're starting this file
-            self.file_started.emit(file_name)
-
-            # Get original file size
-            try:
-                original_size = os.path.getsize(input_path)
-            except:
-                original_size = 0
-
-            # Generate output filename
-            output_path = os.path.join(self.output_folder, file_name)
-
-            # Handle file conflicts
-            output_path = self._handle_conflict(output_path)
+            output_path = self._handle_conflict(os.path.join(self.output_folder, file_name))
 
             if output_path is None:
                 # Skip this file
+                try:
+                    original_size = os.stat(input_path).st_size
+                except OSError:
+                    original_size = 0
+
                 stats = {
                     'original_size': original_size,
                     'new_size': 0,
                     'reduction': 0.0
                 }
                 self.file_completed.emit(None, file_name, "Skipped (file exists)", stats)
-                continue
-
-            # Process based on selected format
-            try:
-                if self.output_format == "Keep Original":
-                    # Compress while keeping original format
-                    success, message, reduction = compress_image(
-                        input_path, output_path, self.quality, self.remove_metadata
-                    )
-                elif self.output_format in ["WebP", "AVIF"]:
-                    # Convert to selected format
-                    success, message, reduction = convert_image(
-                        input_path, output_path, self.output_format,
-                        self.quality, self.remove_metadata
-                    )
-                else:
-                    success = False
-                    message = f"Unsupported format: {self.output_format}"
-                    reduction = 0.0
 
-                # Get new file size
+                processed += 1
+                self.progress_updated.emit(int((processed / total_images) * 100))
+            else:
+                self._taken_names.add(os.path.normcase(os.path.basename(output_path)))
+                jobs.append((input_path, output_path))
+
+        # Submit the batch to the process pool for the selected format.
+        # The cancellation hook lets the batch revoke queued jobs, so
+        # Cancel actually stops the encoding instead of letting the pool
+        # drain every remaining file during teardown.
+        should_cancel = lambda: self.is_cancelled
+        if self.output_format == "Keep Original":
+            results = compress_batch(jobs, self.quality, self.remove_metadata,
+                                     should_cancel=should_cancel)
+        elif self.output_format in ["WebP", "AVIF"]:
+            results = convert_batch(jobs, self.output_format, self.quality,
+                                    self.remove_metadata, self.method,
+                                    should_cancel=should_cancel)
+        else:
+            message = f"Unsupported format: {self.output_format}"
+            results = ((input_path, False, message, 0.0) for input_path, _ in jobs)
+
+        try:
+            # Results arrive in job order, so index back into jobs for the
+            # output path — a dict keyed on input path would collapse
+            # duplicate inputs onto one entry
+            for job_index, (input_path, success, message, reduction) in enumerate(results):
+                # Check if processing was cancelled
+                if self.is_cancelled:
+                    break
+
+                file_name = os.path.basename(input_path)
+                self.file_started.emit(file_name)
+
+                # Get original and new file sizes — one stat each, no
+                # separate exists() probe
                 try:
-                    new_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-                except:
+                    original_size = os.stat(input_path).st_size
+                except OSError:
+                    original_size = 0
+
+                output_path = jobs[job_index][1]
+                try:
+                    new_size = os.stat(output_path).st_size
+                except OSError:
                     new_size = 0
 
                 # Calculate actual reduction percentage
@@ -126,22 +155,14 @@ class ImageProcessorWorker(QThread):
                 # Emit completion signal for this file with stats
                 self.file_completed.emit(success, file_name, message, stats)
 
-            except Exception as e:
-                # Handle unexpected errors
-                failed += 1
-                error_msg = f"Unexpected error: {str(e)}"
-                errors.append(f"{file_name}: {error_msg}")
+                # Update progress
+                processed += 1
+                self.progress_updated.emit(int((processed / total_images) * 100))
 
-                stats = {
-                    'original_size': original_size,
-                    'new_size': 0,
-                    'reduction': 0.0
-                }
-                self.file_completed.emit(False, file_name, error_msg, stats)
-
-            # Update progress
-            progress = int(((idx + 1) / total_images) * 100)
-            self.progress_updated.emit(progress)
+        except Exception as e:
+            # Pool-level failure (e.g. a worker process died)
+            failed += 1
+            errors.append(f"Batch error: {str(e)}")
 
         # Emit completion signal with final statistics
         self.all_completed.emit(successful, failed, errors)
@@ -156,7 +177,7 @@ class ImageProcessorWorker(QThread):
         Returns:
             Final output path, or None to skip file
         """
-        if not os.path.exists(output_path):
+        if os.path.normcase(os.path.basename(output_path)) not in self._taken_names:
             return output_path
 
         if self.conflict_strategy == 'skip':
@@ -170,6 +191,10 @@ class ImageProcessorWorker(QThread):
         """
         Generate unique filename by appending number
 
+        Checked against the claimed-name set, not the filesystem, so a
+        name assigned to an earlier job in the same batch counts as taken
+        even though nothing has been written yet.
+
         Args:
             filepath: Original file path
 
@@ -179,7 +204,7 @@ class ImageProcessorWorker(QThread):
         base, ext = os.path.splitext(filepath)
         counter = 1
 
-        while os.path.exists(f"{base}_{counter}{ext}"):
+        while os.path.normcase(os.path.basename(f"{base}_{counter}{ext}")) in self._taken_names:
             counter += 1
 
         return f"{base}_{counter}{ext}"
@@ -1,5 +1,6 @@
 import sys
 import os
+import multiprocessing
 
 # Add the src directory to the Python path for imports
 if getattr(sys, 'frozen', False):
@@ -13,16 +14,34 @@ else:
 if application_path not in sys.path:
     sys.path.insert(0, application_path)
 
-from PyQt6.QtWidgets import QApplication
-from ui.hub_window import HubWindow
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPixmap
 
 
 def main():
     app = QApplication(sys.argv)
+
+    # Put a splash on screen before importing the hub — HubWindow pulls in
+    # Pillow, QtAwesome and every component module, which dominates cold
+    # start. The theme import below is just constants.
+    from ui.styles.theme import Theme
+    pixmap = QPixmap(420, 240)
+    pixmap.fill(QColor(Theme.BG_PRIMARY))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Loading Imajin...",
+                       Qt.AlignmentFlag.AlignCenter, QColor(Theme.TEXT))
+    splash.show()
+    app.processEvents()
+
+    from ui.hub_window import HubWindow
     window = HubWindow()
+    splash.finish(window)
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == '__main__':
+    # Required for the process-pool batch workers in a frozen exe
+    multiprocessing.freeze_support()
     main()
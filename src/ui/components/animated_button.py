@@ -9,11 +9,18 @@ Features:
 - Smooth color transitions
 """
 
-from PyQt6.QtWidgets import QPushButton, QGraphicsOpacityEffect
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QPushButton, QGraphicsOpacityEffect, QStyle, QStyleOptionButton, QStylePainter
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, pyqtSignal, pyqtProperty, QTimer
+from PyQt6.QtGui import QIcon, QPainter
 from ui.styles.theme import Theme
-import qtawesome as qta
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _qta():
+    """Import QtAwesome on first icon use — keeps it off the cold-start path."""
+    import qtawesome
+    return qtawesome
 
 
 class AnimatedButton(QPushButton):
@@ -27,6 +34,21 @@ class AnimatedButton(QPushButton):
     - Loading: Animated spinner state
     """
 
+    # Shared across instances: QtAwesome rasterizes the SVG glyph on every
+    # qta.icon() call, so identical (name, color) icons are cached once
+    _ICON_CACHE = {}
+    _icon_qsize = None
+
+    # Stylesheet is built once per class on first use — Theme values are
+    # static, and sharing the identical string lets Qt reuse parsed rules
+    _STYLESHEET = None
+
+    # Paint-time scale headroom: painting clips to the widget rect, so the
+    # rest state is drawn pre-shrunk by 1/_MAX_SCALE and scaling up grows
+    # back toward the rect edges instead of past them. 1.08 covers the
+    # 1.05 hover scale plus the OutBack overshoot of the release bounce.
+    _MAX_SCALE = 1.08
+
     def __init__(self, text="", icon_name=None, parent=None):
         """
         Initialize the animated button
@@ -40,9 +62,11 @@ class AnimatedButton(QPushButton):
 
         self.icon_name = icon_name
         self.is_loading = False
-        self.original_geometry = None
-        self.hover_animation = None
-        self.click_animation = None
+        self._scale = 1.0
+
+        # One reusable animation for hover and click — both drive the same
+        # scale property, so per-event construction is pure churn
+        self._scale_animation = QPropertyAnimation(self, b"scale")
 
         # Set icon if provided
         if icon_name:
@@ -54,21 +78,25 @@ class AnimatedButton(QPushButton):
         # Set cursor
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # Store original size for animations
-        self.updateGeometry()
-
     def _set_icon(self, icon_name):
-        """Set button icon from QtAwesome"""
+        """Set button icon from QtAwesome (cached per (name, color))"""
         try:
-            icon = qta.icon(icon_name, color=Theme.TEXT)
+            key = (icon_name, Theme.TEXT)
+            icon = AnimatedButton._ICON_CACHE.get(key)
+            if icon is None:
+                icon = AnimatedButton._ICON_CACHE.setdefault(key, _qta().icon(icon_name, color=Theme.TEXT))
             self.setIcon(icon)
-            self.setIconSize(QSize(Theme.ICON_SIZE, Theme.ICON_SIZE))
+
+            if AnimatedButton._icon_qsize is None:
+                AnimatedButton._icon_qsize = QSize(Theme.ICON_SIZE, Theme.ICON_SIZE)
+            self.setIconSize(AnimatedButton._icon_qsize)
         except Exception as e:
             print(f"Warning: Could not load icon '{icon_name}': {e}")
 
     def _apply_style(self):
         """Apply stylesheet to the button"""
-        self.setStyleSheet(f"""
+        if AnimatedButton._STYLESHEET is None:
+            AnimatedButton._STYLESHEET = f"""
             QPushButton {{
                 background-color: {Theme.BG_SECONDARY};
                 color: {Theme.TEXT};
@@ -95,101 +123,69 @@ class AnimatedButton(QPushButton):
                 color: {Theme.DISABLED_TEXT};
                 border: {Theme.BORDER_THIN}px solid {Theme.DISABLED_BORDER};
             }}
-        """)
+        """
+        self.setStyleSheet(AnimatedButton._STYLESHEET)
+
+    def _get_scale(self):
+        return self._scale
+
+    def _set_scale(self, value):
+        self._scale = value
+        self.update()
+
+    # Animatable paint-time scale — transforming only this button's paint
+    # avoids the layout invalidation that animating b"geometry" caused
+    scale = pyqtProperty(float, _get_scale, _set_scale)
+
+    def paintEvent(self, event):
+        """Paint the button, applying the animated scale around its center"""
+        painter = QStylePainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        factor = self._scale / self._MAX_SCALE
+        center = self.rect().center()
+        painter.translate(center.x(), center.y())
+        painter.scale(factor, factor)
+        painter.translate(-center.x(), -center.y())
+
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter.drawControl(QStyle.ControlElement.CE_PushButton, option)
+
+    def _animate_scale(self, target, duration, easing):
+        """Retarget the shared scale animation and restart it"""
+        animation = self._scale_animation
+        animation.stop()
+        animation.setDuration(duration)
+        animation.setStartValue(self._scale)
+        animation.setEndValue(target)
+        animation.setEasingCurve(easing)
+        animation.start()
 
     def enterEvent(self, event):
         """Handle mouse enter - scale up animation"""
         super().enterEvent(event)
 
         if self.isEnabled() and not self.is_loading:
-            # Stop any existing animation
-            if self.hover_animation and self.hover_animation.state() == QPropertyAnimation.State.Running:
-                self.hover_animation.stop()
-
-            # Store original geometry if not already stored
-            if self.original_geometry is None:
-                self.original_geometry = self.geometry()
-
-            # Calculate scaled geometry
-            original = self.original_geometry
-            scale_factor = 1.05
-            scaled_width = int(original.width() * scale_factor)
-            scaled_height = int(original.height() * scale_factor)
-            scaled_x = original.x() - (scaled_width - original.width()) // 2
-            scaled_y = original.y() - (scaled_height - original.height()) // 2
-
-            scaled_geo = self.geometry()
-            scaled_geo.setRect(scaled_x, scaled_y, scaled_width, scaled_height)
-
-            # Create animation
-            self.hover_animation = QPropertyAnimation(self, b"geometry")
-            self.hover_animation.setDuration(Theme.ANIMATION_FAST)
-            self.hover_animation.setStartValue(self.geometry())
-            self.hover_animation.setEndValue(scaled_geo)
-            self.hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.hover_animation.start()
+            self._animate_scale(1.05, Theme.ANIMATION_FAST, QEasingCurve.Type.OutCubic)
 
     def leaveEvent(self, event):
         """Handle mouse leave - scale back to original"""
         super().leaveEvent(event)
 
-        if self.isEnabled() and not self.is_loading and self.original_geometry:
-            # Stop any existing animation
-            if self.hover_animation and self.hover_animation.state() == QPropertyAnimation.State.Running:
-                self.hover_animation.stop()
-
-            # Animate back to original size
-            self.hover_animation = QPropertyAnimation(self, b"geometry")
-            self.hover_animation.setDuration(Theme.ANIMATION_FAST)
-            self.hover_animation.setStartValue(self.geometry())
-            self.hover_animation.setEndValue(self.original_geometry)
-            self.hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.hover_animation.start()
+        if self.isEnabled() and not self.is_loading:
+            self._animate_scale(1.0, Theme.ANIMATION_FAST, QEasingCurve.Type.OutCubic)
 
     def mousePressEvent(self, event):
         """Handle mouse press - quick scale down"""
         if self.isEnabled() and not self.is_loading:
-            # Quick scale down animation
-            if self.original_geometry:
-                scale_factor = 0.95
-                original = self.original_geometry
-                scaled_width = int(original.width() * scale_factor)
-                scaled_height = int(original.height() * scale_factor)
-                scaled_x = original.x() + (original.width() - scaled_width) // 2
-                scaled_y = original.y() + (original.height() - scaled_height) // 2
-
-                scaled_geo = self.geometry()
-                scaled_geo.setRect(scaled_x, scaled_y, scaled_width, scaled_height)
-
-                self.click_animation = QPropertyAnimation(self, b"geometry")
-                self.click_animation.setDuration(100)
-                self.click_animation.setStartValue(self.geometry())
-                self.click_animation.setEndValue(scaled_geo)
-                self.click_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-                self.click_animation.start()
+            self._animate_scale(0.95, 100, QEasingCurve.Type.OutCubic)
 
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release - bounce back"""
-        if self.isEnabled() and not self.is_loading and self.original_geometry:
-            # Bounce back to hover size (1.05x)
-            scale_factor = 1.05
-            original = self.original_geometry
-            scaled_width = int(original.width() * scale_factor)
-            scaled_height = int(original.height() * scale_factor)
-            scaled_x = original.x() - (scaled_width - original.width()) // 2
-            scaled_y = original.y() - (scaled_height - original.height()) // 2
-
-            scaled_geo = self.geometry()
-            scaled_geo.setRect(scaled_x, scaled_y, scaled_width, scaled_height)
-
-            self.click_animation = QPropertyAnimation(self, b"geometry")
-            self.click_animation.setDuration(Theme.ANIMATION_FAST)
-            self.click_animation.setStartValue(self.geometry())
-            self.click_animation.setEndValue(scaled_geo)
-            self.click_animation.setEasingCurve(QEasingCurve.Type.OutBack)
-            self.click_animation.start()
+        if self.isEnabled() and not self.is_loading:
+            self._animate_scale(1.05, Theme.ANIMATION_FAST, QEasingCurve.Type.OutBack)
 
         super().mouseReleaseEvent(event)
 
@@ -205,6 +201,7 @@ class AnimatedButton(QPushButton):
         if loading:
             # Show loading spinner
             try:
+                qta = _qta()
                 spinner_icon = qta.icon('fa5s.spinner', color=Theme.TEXT, animation=qta.Spin(self))
                 self.setIcon(spinner_icon)
                 self.setEnabled(False)
@@ -230,23 +227,20 @@ class AnimatedButton(QPushButton):
         if not self.is_loading:
             self._set_icon(icon_name)
 
-    def resizeEvent(self, event):
-        """Update original geometry when button is resized"""
-        super().resizeEvent(event)
-        if not self.hover_animation or self.hover_animation.state() != QPropertyAnimation.State.Running:
-            self.original_geometry = self.geometry()
-
 
 class PrimaryButton(AnimatedButton):
     """Styled primary action button with accent color"""
 
+    _STYLESHEET = None
+
     def __init__(self, text="", icon_name=None, parent=None):
         super().__init__(text, icon_name, parent)
         self._apply_primary_style()
 
     def _apply_primary_style(self):
         """Apply primary button styling"""
-        self.setStyleSheet(f"""
+        if PrimaryButton._STYLESHEET is None:
+            PrimaryButton._STYLESHEET = f"""
             QPushButton {{
                 background-color: {Theme.ACCENT};
                 color: {Theme.TEXT};
@@ -273,19 +267,23 @@ class PrimaryButton(AnimatedButton):
                 color: {Theme.DISABLED_TEXT};
                 border: {Theme.BORDER_THIN}px solid {Theme.DISABLED_BORDER};
             }}
-        """)
+        """
+        self.setStyleSheet(PrimaryButton._STYLESHEET)
 
 
 class DangerButton(AnimatedButton):
     """Styled danger/cancel button with red accent"""
 
+    _STYLESHEET = None
+
     def __init__(self, text="", icon_name=None, parent=None):
         super().__init__(text, icon_name, parent)
         self._apply_danger_style()
 
     def _apply_danger_style(self):
         """Apply danger button styling"""
-        self.setStyleSheet(f"""
+        if DangerButton._STYLESHEET is None:
+            DangerButton._STYLESHEET = f"""
             QPushButton {{
                 background-color: {Theme.ERROR};
                 color: {Theme.WHITE};
@@ -298,7 +296,7 @@ class DangerButton(AnimatedButton):
             }}
 
             QPushButton:hover {{
-                background-color: {Theme.darken_color(Theme.ERROR, 0.2)};
+                background-color: {Theme.ERROR_HOVER};
                 color: {Theme.WHITE};
             }}
 
@@ -312,4 +310,5 @@ class DangerButton(AnimatedButton):
                 color: {Theme.DISABLED_TEXT};
                 border: {Theme.BORDER_THIN}px solid {Theme.DISABLED_BORDER};
             }}
-        """)
+        """
+        self.setStyleSheet(DangerButton._STYLESHEET)
@@ -25,6 +25,10 @@ class CardWidget(QWidget):
 
     collapsed = pyqtSignal(bool)  # Emitted when collapsed state changes
 
+    # Shared by every card — the effect itself must be per-instance
+    # (Qt owns it), but the color never changes
+    _SHADOW_COLOR = QColor(255, 45, 120, 70)
+
     def __init__(self, title="", collapsible=False, parent=None):
         """
         Initialize the card widget
@@ -39,12 +43,13 @@ class CardWidget(QWidget):
         self.expanded = True
         self.title_text = title
 
-        # Create shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(Theme.SHADOW_BLUR)
-        shadow.setColor(QColor(255, 45, 120, 70))
-        shadow.setOffset(Theme.SHADOW_OFFSET_X, Theme.SHADOW_OFFSET_Y)
-        self.setGraphicsEffect(shadow)
+        # Create shadow effect (skipped entirely when shadows are disabled)
+        if Theme.ENABLE_SHADOWS:
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(Theme.SHADOW_BLUR)
+            shadow.setColor(self._SHADOW_COLOR)
+            shadow.setOffset(Theme.SHADOW_OFFSET_X, Theme.SHADOW_OFFSET_Y)
+            self.setGraphicsEffect(shadow)
 
         # Main layout
         self.main_layout = QVBoxLayout(self)
@@ -175,17 +180,22 @@ class CardWidget(QWidget):
                 title_label.setText(title)
 
     def clear_content(self):
-        """Remove all widgets from the content area"""
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # Recursively clear sublayouts
-                while item.layout().count():
-                    subitem = item.layout().takeAt(0)
-                    if subitem.widget():
-                        subitem.widget().deleteLater()
+        """Remove all widgets from the content area
+
+        Swaps in a fresh content widget instead of popping layout items
+        one by one — Qt deletes the whole old subtree in C++.
+        """
+        old = self.content_widget
+        self.main_layout.removeWidget(old)
+        old.setParent(None)
+        old.deleteLater()
+
+        self.content_widget = QWidget()
+        self.content_layout = QVBoxLayout(self.content_widget)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content_layout.setSpacing(Theme.SPACING_MD)
+        self.content_widget.setMaximumHeight(self.content_max_height if self.expanded else 0)
+        self.main_layout.addWidget(self.content_widget)
 
     def set_content_max_height(self, height):
         """
@@ -5,11 +5,85 @@ Displays per-file processing results with timestamps, icons, and statistics.
 Supports auto-scroll, export to file, and color-coded entries.
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QFileDialog
-from PyQt6.QtCore import Qt, QTime
-from PyQt6.QtGui import QTextCursor, QTextCharFormat, QColor, QFont
+from html import escape as _esc
+from time import strftime
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QFileDialog
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
 from ui.styles.theme import Theme
-import qtawesome as qta
+
+# Stylesheets are evaluated once at import — Theme tokens are static, and
+# sharing the string across instances lets Qt reuse the parsed rules
+_LOG_QSS = f"""
+    QPlainTextEdit {{
+        background-color: {Theme.WHITE};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_MD}px;
+        font-family: '{Theme.FONT_FAMILY}';
+        padding: {Theme.SPACING_SM}px;
+        color: {Theme.TEXT};
+    }}
+"""
+
+_LOG_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Theme.BG_SECONDARY};
+        color: {Theme.TEXT};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_SM}px;
+        padding: {Theme.SPACING_XS}px {Theme.SPACING_SM}px;
+        font-family: '{Theme.FONT_FAMILY}';
+        font-size: {Theme.FONT_SIZE_SMALL}px;
+    }}
+
+    QPushButton:hover {{
+        background-color: {Theme.ACCENT};
+    }}
+
+    QPushButton:pressed {{
+        background-color: {Theme.TEXT};
+        color: {Theme.BG_PRIMARY};
+    }}
+"""
+
+_MB = 1024 * 1024
+
+
+def _fmt_stats(orig, new, red):
+    """Format the size/reduction suffix for a log entry"""
+    return f"({orig / _MB:.2f}MB → {new / _MB:.2f}MB, {red:.1f}% reduction)"
+
+
+class _ExportSignals(QObject):
+    """Signal holder for _ExportTask — QRunnable cannot emit directly"""
+
+    done = pyqtSignal(str, object)  # (path, error message or None)
+
+
+class _ExportTask(QRunnable):
+    """Writes the exported log lines on a pool thread
+
+    A multi-MB export is a single blocking write; running it on the UI
+    thread stalls the event loop until the disk call returns.
+    """
+
+    def __init__(self, path, lines, signals):
+        super().__init__()
+        self._path = path
+        self._lines = lines
+        self._signals = signals
+
+    def run(self):
+        try:
+            with open(self._path, 'wb', buffering=1 << 20) as f:
+                for line in self._lines:
+                    f.write(line.encode('utf-8'))
+                    f.write(b'\n')
+        except Exception as e:
+            self._signals.done.emit(self._path, str(e))
+        else:
+            self._signals.done.emit(self._path, None)
 
 
 class ProcessingLog(QWidget):
@@ -25,6 +99,20 @@ class ProcessingLog(QWidget):
     - Clear log button
     """
 
+    # Pre-built per-status icon and HTML span opener — building these per
+    # entry (like the old per-call QTextCharFormat/QColor/QFont) is churn
+    _STATUS = {
+        True: ("✓", f'<span style="color:{Theme.SUCCESS}">'),
+        False: ("✗", f'<span style="color:{Theme.ERROR}">'),
+        None: ("⚠", f'<span style="color:{Theme.WARNING}">'),
+    }
+    _INFO_SPAN = f'<span style="color:{Theme.INFO}">'
+
+    # Sentinel status for info lines — they carry no filename or stats,
+    # but must ride the same hidden-entry stash as per-file entries so a
+    # showEvent replay keeps arrival order
+    _INFO = object()
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -33,21 +121,15 @@ class ProcessingLog(QWidget):
         main_layout.setSpacing(Theme.SPACING_SM)
         main_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Log text edit
-        self.log_text = QTextEdit()
+        # Log text edit — QPlainTextEdit is optimized for tail-append, and
+        # the block cap drops the oldest lines like a ring buffer so long
+        # sessions don't accumulate an ever-slower document
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(2000)
         self.log_text.setMaximumHeight(200)
         self.log_text.setFont(QFont(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL))
-        self.log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {Theme.WHITE};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_MD}px;
-                font-family: '{Theme.FONT_FAMILY}';
-                padding: {Theme.SPACING_SM}px;
-                color: {Theme.TEXT};
-            }}
-        """)
+        self.log_text.setStyleSheet(_LOG_QSS)
 
         main_layout.addWidget(self.log_text)
 
@@ -76,28 +158,31 @@ class ProcessingLog(QWidget):
         # Entry counter
         self.entry_count = 0
 
+        # Entries are queued and flushed in one batch — appending per file
+        # makes QTextEdit re-layout and re-scroll for every line, which is
+        # what kills responsiveness on large runs
+        self._pending = []
+        # Raw entries captured while the widget is hidden — formatting is
+        # deferred until the log is actually shown
+        self._hidden = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush)
+
+        # Save dialog is built lazily and reused — the static
+        # getSaveFileName rebuilds the whole dialog (and re-scans the
+        # start directory) on every export
+        self._export_dialog = None
+
+        # Export writes happen on the global thread pool; results come
+        # back through a queued signal
+        self._export_signals = _ExportSignals()
+        self._export_signals.done.connect(self._on_export_done)
+
     def _apply_button_style(self, button):
         """Apply styling to log buttons"""
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.BG_SECONDARY};
-                color: {Theme.TEXT};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_SM}px;
-                padding: {Theme.SPACING_XS}px {Theme.SPACING_SM}px;
-                font-family: '{Theme.FONT_FAMILY}';
-                font-size: {Theme.FONT_SIZE_SMALL}px;
-            }}
-
-            QPushButton:hover {{
-                background-color: {Theme.ACCENT};
-            }}
-
-            QPushButton:pressed {{
-                background-color: {Theme.TEXT};
-                color: {Theme.BG_PRIMARY};
-            }}
-        """)
+        button.setStyleSheet(_LOG_BUTTON_QSS)
 
     def add_entry(self, success, filename, message, stats=None):
         """
@@ -109,50 +194,51 @@ class ProcessingLog(QWidget):
             message: Status message
             stats: Optional dict with 'original_size', 'new_size', 'reduction'
         """
-        # Get current time
-        timestamp = QTime.currentTime().toString("HH:mm:ss")
-
-        # Choose icon and color based on status
-        if success is True:
-            icon = "✓"
-            color = Theme.SUCCESS
-        elif success is False:
-            icon = "✗"
-            color = Theme.ERROR
-        else:  # Warning/info
-            icon = "⚠"
-            color = Theme.WARNING
+        # Get current time — strftime is cheaper than round-tripping
+        # through QTime for a fixed-format stamp
+        timestamp = strftime("%H:%M:%S")
+        self.entry_count += 1
+
+        # While the panel is hidden there is nothing to paint — stash the
+        # raw entry and skip all formatting until showEvent
+        if not self.isVisible():
+            self._hidden.append((timestamp, success, filename, message, stats))
+            return
+
+        self._format_entry(timestamp, success, filename, message, stats)
+
+    def _format_entry(self, timestamp, success, filename, message, stats):
+        """Build the rich-text line for one entry and queue it"""
+        if success is self._INFO:
+            self._queue(self._INFO_SPAN, f"[{timestamp}] ℹ {message}")
+            return
+
+        # Choose icon and span based on status
+        icon, span_open = self._STATUS[success if success in self._STATUS else None]
 
         # Build entry text
         entry_parts = [f"[{timestamp}]", icon, filename, "→", message]
 
         # Add statistics if provided
         if stats and 'reduction' in stats:
-            orig_mb = stats.get('original_size', 0) / (1024 * 1024)
-            new_mb = stats.get('new_size', 0) / (1024 * 1024)
-            reduction = stats.get('reduction', 0)
-            stats_text = f"({orig_mb:.2f}MB → {new_mb:.2f}MB, {reduction:.1f}% reduction)"
-            entry_parts.append(stats_text)
-
-        entry_text = " ".join(entry_parts)
+            get = stats.get
+            entry_parts.append(_fmt_stats(get('original_size', 0),
+                                          get('new_size', 0),
+                                          get('reduction', 0)))
 
-        # Get cursor at end of document
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._queue(span_open, " ".join(entry_parts))
 
-        # Create format for colored text
-        format = QTextCharFormat()
-        format.setForeground(QColor(color))
-        format.setFont(QFont(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL))
-
-        # Insert entry with formatting
-        cursor.insertText(entry_text + "\n", format)
-
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+    def _drain_hidden(self):
+        """Format entries that arrived while the widget was hidden"""
+        if not self._hidden:
+            return
+        for args in self._hidden:
+            self._format_entry(*args)
+        self._hidden.clear()
 
-        self.entry_count += 1
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._drain_hidden()
 
     def add_success(self, filename, message, stats=None):
         """Add a success entry"""
@@ -168,21 +254,48 @@ class ProcessingLog(QWidget):
 
     def add_info(self, message):
         """Add a general info message (no filename)"""
-        timestamp = QTime.currentTime().toString("HH:mm:ss")
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        timestamp = strftime("%H:%M:%S")
 
-        format = QTextCharFormat()
-        format.setForeground(QColor(Theme.INFO))
-        format.setFont(QFont(Theme.FONT_FAMILY, Theme.FONT_SIZE_SMALL))
+        # Stash alongside per-file entries while hidden — queueing an
+        # info line directly would flush it ahead of stashed entries and
+        # reorder the log on showEvent
+        if not self.isVisible():
+            self._hidden.append((timestamp, self._INFO, None, message, None))
+            return
+
+        self._format_entry(timestamp, self._INFO, None, message, None)
+
+    def _queue(self, span_open, text):
+        """Queue an entry for the next batched flush"""
+        self._pending.append(f"{span_open}{_esc(text)}</span>")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Insert all pending entries in one cursor operation"""
+        if not self._pending:
+            return
 
-        cursor.insertText(f"[{timestamp}] ℹ {message}\n", format)
+        # One <p> per entry keeps every entry its own text block — a
+        # <br> join would merge the whole flush into a single block,
+        # breaking the block-count cap and the block-by-block export
+        chunk = "".join(f"<p>{entry}</p>" for entry in self._pending)
+        self._pending.clear()
 
+        # Only follow the tail if the user hasn't scrolled away from it
         scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        self.log_text.appendHtml(chunk)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def clear_log(self):
         """Clear all log entries"""
+        self._pending.clear()
+        self._hidden.clear()
+        self._flush_timer.stop()
         self.log_text.clear()
         self.entry_count = 0
 
@@ -191,21 +304,42 @@ class ProcessingLog(QWidget):
         if self.entry_count == 0:
             return
 
-        # Open file dialog
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Log",
-            "processing_log.txt",
-            "Text Files (*.txt);;All Files (*.*)"
-        )
+        # Make sure queued entries are in the document before exporting
+        self._drain_hidden()
+        self._flush()
+
+        # Build the dialog once; later exports reopen it instantly and
+        # keep the last-used folder
+        if self._export_dialog is None:
+            self._export_dialog = QFileDialog(self, "Export Log")
+            self._export_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            self._export_dialog.setNameFilter("Text Files (*.txt);;All Files (*.*)")
+            self._export_dialog.setDefaultSuffix("txt")
+            self._export_dialog.selectFile("processing_log.txt")
+
+        if not self._export_dialog.exec():
+            return
+        selected = self._export_dialog.selectedFiles()
+        file_path = selected[0] if selected else None
 
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.toPlainText())
-                self.add_info(f"Log exported to {file_path}")
-            except Exception as e:
-                self.add_error("Export", str(e))
+            # Snapshot the document line by line on the UI thread (the
+            # document is not thread-safe), then hand the write to the
+            # pool so the event loop never blocks on disk
+            lines = []
+            block = self.log_text.document().firstBlock()
+            while block.isValid():
+                lines.append(block.text())
+                block = block.next()
+            QThreadPool.globalInstance().start(
+                _ExportTask(file_path, lines, self._export_signals))
+
+    def _on_export_done(self, path, error):
+        """Report the result of a background export"""
+        if error is None:
+            self.add_info(f"Log exported to {path}")
+        else:
+            self.add_error("Export", error)
 
     def get_entry_count(self):
         """Get number of log entries"""
@@ -6,9 +6,67 @@ and smooth animated transitions between values.
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QPushButton, QButtonGroup
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, pyqtSignal
 from ui.styles.theme import Theme
 
+# Evaluated once at import — every preset button shares the same string,
+# so Qt parses the rules a single time
+_PRESET_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Theme.BG_SECONDARY};
+        color: {Theme.TEXT};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_LG}px;
+        padding: {Theme.SPACING_XS}px {Theme.SPACING_SM}px;
+        font-family: '{Theme.FONT_FAMILY}';
+        font-size: {Theme.FONT_SIZE_SMALL}px;
+        font-weight: bold;
+    }}
+
+    QPushButton:hover {{
+        background-color: {Theme.ACCENT_HOVER};
+    }}
+
+    QPushButton:checked {{
+        background-color: {Theme.ACCENT};
+        color: {Theme.TEXT};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+    }}
+
+    QPushButton:disabled {{
+        background-color: {Theme.DISABLED_BG};
+        color: {Theme.DISABLED_TEXT};
+    }}
+"""
+
+_SLIDER_QSS = f"""
+    QSlider::groove:horizontal {{
+        background: {Theme.BG_SECONDARY};
+        height: 8px;
+        border-radius: 4px;
+        border: 1px solid {Theme.TEXT};
+    }}
+
+    QSlider::handle:horizontal {{
+        background: {Theme.ACCENT};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        width: {Theme.SLIDER_HANDLE_SIZE}px;
+        height: {Theme.SLIDER_HANDLE_SIZE}px;
+        margin: -7px 0;
+        border-radius: {Theme.RADIUS_ROUND}px;
+    }}
+
+    QSlider::handle:horizontal:hover {{
+        background: {Theme.TEXT};
+        border: {Theme.BORDER_THIN}px solid {Theme.ACCENT};
+    }}
+
+    QSlider::sub-page:horizontal {{
+        background: {Theme.ACCENT};
+        border-radius: 4px;
+    }}
+"""
+
 
 class QualityPresetsWidget(QWidget):
     """
@@ -32,6 +90,15 @@ class QualityPresetsWidget(QWidget):
 
         self.current_preset = "Balanced"  # Default preset
         self.slider_animation = None
+        self._last_value = -1  # Short-circuits repeat slider ticks
+        self._animating = False  # True while a preset animation drives the slider
+
+        # Debounce value_changed — a drag fires ~100 intermediate ticks,
+        # and downstream slots only care about where the slider settles
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(80)
+        self._emit_timer.timeout.connect(self._emit_value)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -103,6 +170,13 @@ class QualityPresetsWidget(QWidget):
         # Set default preset as checked
         self.balanced_button.setChecked(True)
 
+        # O(1) preset lookup for the slider-drag hot path
+        self._preset_map = {
+            self.PRESET_WEB: ("Web", self.web_button),
+            self.PRESET_BALANCED: ("Balanced", self.balanced_button),
+            self.PRESET_HIGH: ("High", self.high_button),
+        }
+
     def _create_preset_button(self, text, value, tooltip):
         """Create a preset button"""
         button = QPushButton(text)
@@ -122,63 +196,11 @@ class QualityPresetsWidget(QWidget):
 
     def _apply_preset_button_style(self, button):
         """Apply styling to preset button"""
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.BG_SECONDARY};
-                color: {Theme.TEXT};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_LG}px;
-                padding: {Theme.SPACING_XS}px {Theme.SPACING_SM}px;
-                font-family: '{Theme.FONT_FAMILY}';
-                font-size: {Theme.FONT_SIZE_SMALL}px;
-                font-weight: bold;
-            }}
-
-            QPushButton:hover {{
-                background-color: {Theme.lighten_color(Theme.ACCENT, 0.3)};
-            }}
-
-            QPushButton:checked {{
-                background-color: {Theme.ACCENT};
-                color: {Theme.TEXT};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-            }}
-
-            QPushButton:disabled {{
-                background-color: {Theme.DISABLED_BG};
-                color: {Theme.DISABLED_TEXT};
-            }}
-        """)
+        button.setStyleSheet(_PRESET_BUTTON_QSS)
 
     def _apply_slider_style(self):
         """Apply styling to slider"""
-        self.slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {Theme.BG_SECONDARY};
-                height: 8px;
-                border-radius: 4px;
-                border: 1px solid {Theme.TEXT};
-            }}
-
-            QSlider::handle:horizontal {{
-                background: {Theme.ACCENT};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                width: {Theme.SLIDER_HANDLE_SIZE}px;
-                height: {Theme.SLIDER_HANDLE_SIZE}px;
-                margin: -7px 0;
-                border-radius: {Theme.RADIUS_ROUND}px;
-            }}
-
-            QSlider::handle:horizontal:hover {{
-                background: {Theme.TEXT};
-                border: {Theme.BORDER_THIN}px solid {Theme.ACCENT};
-            }}
-
-            QSlider::sub-page:horizontal {{
-                background: {Theme.ACCENT};
-                border-radius: 4px;
-            }}
-        """)
+        self.slider.setStyleSheet(_SLIDER_QSS)
 
     def _on_preset_clicked(self, value, preset_name):
         """Handle preset button click"""
@@ -194,25 +216,33 @@ class QualityPresetsWidget(QWidget):
 
     def _on_slider_changed(self, value):
         """Handle slider value change"""
+        if value == self._last_value:
+            return
+        self._last_value = value
+
         # Update value label
         self.value_label.setText(f"{value}%")
 
         # Check if value matches a preset
-        if value == self.PRESET_WEB:
-            self.current_preset = "Web"
-            self.web_button.setChecked(True)
-        elif value == self.PRESET_BALANCED:
-            self.current_preset = "Balanced"
-            self.balanced_button.setChecked(True)
-        elif value == self.PRESET_HIGH:
-            self.current_preset = "High"
-            self.high_button.setChecked(True)
+        entry = self._preset_map.get(value)
+        if entry:
+            self.current_preset, button = entry
         else:
-            self.current_preset = "Custom"
-            self.custom_button.setChecked(True)
+            self.current_preset, button = "Custom", self.custom_button
+        button.setChecked(True)
+
+        # While an animation drives the slider, every intermediate frame
+        # lands here — keep the label live but hold the signal until the
+        # animation settles
+        if self._animating:
+            return
 
-        # Emit signal
-        self.value_changed.emit(value)
+        # Emit signal (coalesced — restarting the timer drops older ticks)
+        self._emit_timer.start()
+
+    def _emit_value(self):
+        """Emit the debounced value_changed signal"""
+        self.value_changed.emit(self.slider.value())
 
     def _animate_slider_to(self, target_value):
         """Animate slider to target value"""
@@ -226,8 +256,15 @@ class QualityPresetsWidget(QWidget):
         self.slider_animation.setStartValue(self.slider.value())
         self.slider_animation.setEndValue(target_value)
         self.slider_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.slider_animation.finished.connect(self._on_animation_finished)
+        self._animating = True
         self.slider_animation.start()
 
+    def _on_animation_finished(self):
+        """Resume signalling and emit the settled value once"""
+        self._animating = False
+        self.value_changed.emit(self.slider.value())
+
     def get_value(self):
         """Get current quality value"""
         return self.slider.value()
@@ -4,13 +4,108 @@ ConflictDialog - File conflict resolution dialog for Imajin Image Processor
 Allows users to choose how to handle existing files in the output folder.
 """
 
+import os
+
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                               QRadioButton, QCheckBox, QPushButton,
-                              QScrollArea, QWidget, QButtonGroup)
-from PyQt6.QtCore import Qt
+                              QListView, QButtonGroup)
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
 from ui.styles.theme import Theme
 from core.conflict_checker import format_file_size, format_modified_date
 
+# Stylesheets built once at import — the dialog used to re-evaluate these
+# f-strings for every widget on every open
+_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {Theme.BG_PRIMARY};
+        font-family: '{Theme.FONT_FAMILY}';
+    }}
+"""
+
+_HEADER_QSS = f"""
+    color: {Theme.WARNING};
+    padding: {Theme.SPACING_SM}px;
+    background-color: {Theme.WARNING_SOFT};
+    border-radius: {Theme.RADIUS_MD}px;
+"""
+
+_LIST_QSS = f"""
+    QListView {{
+        background-color: {Theme.BG_PRIMARY};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_MD}px;
+        color: {Theme.TEXT};
+        padding: {Theme.SPACING_SM}px;
+    }}
+"""
+
+_TEXT_QSS = f"color: {Theme.TEXT};"
+_STRATEGY_LABEL_QSS = f"color: {Theme.TEXT}; margin-top: {Theme.SPACING_SM}px;"
+
+_CANCEL_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Theme.BG_SECONDARY};
+        color: {Theme.TEXT};
+        border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_MD}px;
+        padding: {Theme.SPACING_SM}px {Theme.SPACING_LG}px;
+        font-family: '{Theme.FONT_FAMILY}';
+    }}
+    QPushButton:hover {{
+        background-color: {Theme.ACCENT};
+    }}
+"""
+
+_CONTINUE_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Theme.ACCENT};
+        color: {Theme.TEXT};
+        border: {Theme.BORDER_THICK}px solid {Theme.TEXT};
+        border-radius: {Theme.RADIUS_MD}px;
+        padding: {Theme.SPACING_SM}px {Theme.SPACING_LG}px;
+        font-family: '{Theme.FONT_FAMILY}';
+    }}
+    QPushButton:hover {{
+        background-color: {Theme.TEXT};
+        color: {Theme.ACCENT};
+    }}
+"""
+
+
+class ConflictModel(QAbstractListModel):
+    """
+    List model exposing one row per conflict
+
+    Only the rows the view actually paints are formatted — building a
+    QWidget per conflict made the dialog scale with the conflict count
+    instead of the viewport.
+    """
+
+    def __init__(self, conflicts, parent=None):
+        super().__init__(parent)
+        self.conflicts = conflicts
+        # Each row is formatted at most once — data() is called for every
+        # repaint of a visible row, and the date/size formatters are the
+        # expensive part
+        self._rows = [None] * len(conflicts)
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.conflicts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._rows[row]
+        if text is None:
+            conflict = self.conflicts[row]
+            filename = conflict.get('output_filename', os.path.basename(conflict['output']))
+            modified = format_modified_date(conflict.get('existing_modified', 0))
+            size = format_file_size(conflict.get('existing_size', 0))
+            text = f"• {filename}\n  Modified: {modified}  |  Size: {size}"
+            self._rows[row] = text
+        return text
+
 
 class ConflictDialog(QDialog):
     """
@@ -52,12 +147,7 @@ class ConflictDialog(QDialog):
         # Header
         header = QLabel(f"⚠ {len(self.conflicts)} file(s) already exist in output folder")
         header.setFont(Theme.get_qfont(Theme.FONT_SIZE_LARGE, bold=True))
-        header.setStyleSheet(f"""
-            color: {Theme.WARNING};
-            padding: {Theme.SPACING_SM}px;
-            background-color: {Theme.lighten_color(Theme.WARNING, 0.8)};
-            border-radius: {Theme.RADIUS_MD}px;
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(header)
 
         # Conflict list (scrollable)
@@ -69,7 +159,7 @@ class ConflictDialog(QDialog):
         # Remember choice checkbox
         self.remember_checkbox = QCheckBox("Remember choice for this session")
         self.remember_checkbox.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL))
-        self.remember_checkbox.setStyleSheet(f"color: {Theme.TEXT};")
+        self.remember_checkbox.setStyleSheet(_TEXT_QSS)
         layout.addWidget(self.remember_checkbox)
 
         # Buttons
@@ -79,73 +169,24 @@ class ConflictDialog(QDialog):
         """Create scrollable list of conflicts"""
         scroll_label = QLabel("The following files will be affected:")
         scroll_label.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL, bold=True))
-        scroll_label.setStyleSheet(f"color: {Theme.TEXT};")
+        scroll_label.setStyleSheet(_TEXT_QSS)
         parent_layout.addWidget(scroll_label)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMaximumHeight(200)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {Theme.WHITE};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_MD}px;
-            }}
-        """)
-
-        conflict_widget = QWidget()
-        conflict_layout = QVBoxLayout(conflict_widget)
-        conflict_layout.setSpacing(Theme.SPACING_SM)
-        conflict_layout.setContentsMargins(Theme.SPACING_SM, Theme.SPACING_SM,
-                                          Theme.SPACING_SM, Theme.SPACING_SM)
-
-        for conflict in self.conflicts:
-            item = self._create_conflict_item(conflict)
-            conflict_layout.addWidget(item)
-
-        conflict_layout.addStretch()
-
-        scroll.setWidget(conflict_widget)
-        parent_layout.addWidget(scroll)
-
-    def _create_conflict_item(self, conflict):
-        """Create a single conflict item widget"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(Theme.SPACING_SM, Theme.SPACING_SM,
-                                  Theme.SPACING_SM, Theme.SPACING_SM)
-        layout.setSpacing(2)
-
-        # Filename
-        filename = conflict.get('output_filename', os.path.basename(conflict['output']))
-        filename_label = QLabel(f"• {filename}")
-        filename_label.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL, bold=True))
-        filename_label.setStyleSheet(f"color: {Theme.TEXT};")
-
-        # Modified date and size
-        modified = format_modified_date(conflict.get('existing_modified', 0))
-        size = format_file_size(conflict.get('existing_size', 0))
-        info_label = QLabel(f"  Modified: {modified}  |  Size: {size}")
-        info_label.setFont(Theme.get_qfont(Theme.FONT_SIZE_SMALL))
-        info_label.setStyleSheet(f"color: {Theme.darken_color(Theme.TEXT, 0.3)};")
-
-        layout.addWidget(filename_label)
-        layout.addWidget(info_label)
-
-        widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {Theme.BG_PRIMARY};
-                border-radius: {Theme.RADIUS_SM}px;
-            }}
-        """)
-
-        return widget
+        self.conflict_view = QListView()
+        self.conflict_view.setModel(ConflictModel(self.conflicts, self))
+        self.conflict_view.setUniformItemSizes(True)
+        self.conflict_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.conflict_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.conflict_view.setMaximumHeight(200)
+        self.conflict_view.setFont(Theme.get_qfont(Theme.FONT_SIZE_SMALL))
+        self.conflict_view.setStyleSheet(_LIST_QSS)
+        parent_layout.addWidget(self.conflict_view)
 
     def create_strategy_selection(self, parent_layout):
         """Create strategy radio buttons"""
         strategy_label = QLabel("Choose action:")
         strategy_label.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL, bold=True))
-        strategy_label.setStyleSheet(f"color: {Theme.TEXT}; margin-top: {Theme.SPACING_SM}px;")
+        strategy_label.setStyleSheet(_STRATEGY_LABEL_QSS)
         parent_layout.addWidget(strategy_label)
 
         self.strategy_group = QButtonGroup(self)
@@ -153,20 +194,20 @@ class ConflictDialog(QDialog):
         # Replace option
         self.replace_radio = QRadioButton("Replace all existing files")
         self.replace_radio.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL))
-        self.replace_radio.setStyleSheet(f"color: {Theme.TEXT};")
+        self.replace_radio.setStyleSheet(_TEXT_QSS)
         self.replace_radio.setChecked(True)  # Default
         self.strategy_group.addButton(self.replace_radio, 0)
 
         # Skip option
         self.skip_radio = QRadioButton("Skip existing files")
         self.skip_radio.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL))
-        self.skip_radio.setStyleSheet(f"color: {Theme.TEXT};")
+        self.skip_radio.setStyleSheet(_TEXT_QSS)
         self.strategy_group.addButton(self.skip_radio, 1)
 
         # Auto-rename option
         self.rename_radio = QRadioButton("Auto-rename (file_1.jpg, file_2.jpg, ...)")
         self.rename_radio.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL))
-        self.rename_radio.setStyleSheet(f"color: {Theme.TEXT};")
+        self.rename_radio.setStyleSheet(_TEXT_QSS)
         self.strategy_group.addButton(self.rename_radio, 2)
 
         parent_layout.addWidget(self.replace_radio)
@@ -183,38 +224,13 @@ class ConflictDialog(QDialog):
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL, bold=True))
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.BG_SECONDARY};
-                color: {Theme.TEXT};
-                border: {Theme.BORDER_THIN}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_MD}px;
-                padding: {Theme.SPACING_SM}px {Theme.SPACING_LG}px;
-                font-family: '{Theme.FONT_FAMILY}';
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.ACCENT};
-            }}
-        """)
+        cancel_btn.setStyleSheet(_CANCEL_BUTTON_QSS)
 
         # Continue button
         continue_btn = QPushButton("Continue Processing")
         continue_btn.setFont(Theme.get_qfont(Theme.FONT_SIZE_NORMAL, bold=True))
         continue_btn.clicked.connect(self.accept)
-        continue_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.ACCENT};
-                color: {Theme.TEXT};
-                border: {Theme.BORDER_THICK}px solid {Theme.TEXT};
-                border-radius: {Theme.RADIUS_MD}px;
-                padding: {Theme.SPACING_SM}px {Theme.SPACING_LG}px;
-                font-family: '{Theme.FONT_FAMILY}';
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.TEXT};
-                color: {Theme.ACCENT};
-            }}
-        """)
+        continue_btn.setStyleSheet(_CONTINUE_BUTTON_QSS)
 
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(continue_btn)
@@ -223,12 +239,7 @@ class ConflictDialog(QDialog):
 
     def _apply_style(self):
         """Apply dialog styling"""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {Theme.BG_PRIMARY};
-                font-family: '{Theme.FONT_FAMILY}';
-            }}
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
     def get_strategy(self):
         """
@@ -279,6 +279,13 @@ class ImageConverterWindow(QWidget):
         self.remove_metadata_checkbox.stateChanged.connect(self._save_settings)
         layout.addWidget(self.remove_metadata_checkbox)
 
+        self.extra_compression_checkbox = QCheckBox("Extra compression (slower)")
+        self.extra_compression_checkbox.setChecked(False)
+        self.extra_compression_checkbox.setToolTip(
+            "Use the encoder's slowest analysis mode — marginally smaller files")
+        self.extra_compression_checkbox.stateChanged.connect(self._save_settings)
+        layout.addWidget(self.extra_compression_checkbox)
+
         layout.addSpacing(8)
         divider = QFrame()
         divider.setFixedHeight(2)
@@ -400,6 +407,7 @@ class ImageConverterWindow(QWidget):
                     cfg = json.load(f)
                 self.output_folder_input.setText(cfg.get('output_folder', self.default_output_folder))
                 self.remove_metadata_checkbox.setChecked(cfg.get('remove_metadata', False))
+                self.extra_compression_checkbox.setChecked(cfg.get('extra_compression', False))
             except Exception:
                 pass
 
@@ -408,6 +416,7 @@ class ImageConverterWindow(QWidget):
             cfg = {
                 'output_folder': self.output_folder_input.text(),
                 'remove_metadata': self.remove_metadata_checkbox.isChecked(),
+                'extra_compression': self.extra_compression_checkbox.isChecked(),
             }
             with open(self.config_file, 'w') as f:
                 json.dump(cfg, f, indent=4)
@@ -444,6 +453,7 @@ class ImageConverterWindow(QWidget):
         quality = validate_quality(self.quality_presets.get_value())
         remove_metadata = self.remove_metadata_checkbox.isChecked()
         selected_format = self.format_selector.currentText()
+        method = 6 if self.extra_compression_checkbox.isChecked() else 4
 
         self.process_button.setEnabled(False)
         self.progress_bar.setVisible(True)
@@ -454,7 +464,8 @@ class ImageConverterWindow(QWidget):
         self.processing_log.setVisible(True)
 
         self.worker = ImageProcessorWorker(
-            images, output_folder, quality, remove_metadata, selected_format
+            images, output_folder, quality, remove_metadata, selected_format,
+            method=method
         )
         self.worker.progress_updated.connect(self._on_progress)
         self.worker.file_started.connect(self._on_file_started)
@@ -6,6 +6,48 @@ border radius, animation durations, and shadow definitions to ensure
 consistent styling throughout the application.
 """
 
+from functools import lru_cache
+
+
+# Pure color derivations, memoized at module level — the app only ever
+# derives from the handful of palette constants, so stylesheet builders
+# hit the cache instead of re-parsing hex strings
+@lru_cache(maxsize=256)
+def _lighten(color, factor):
+    # One int() parse plus shifts — cheaper than three substring parses
+    packed = int(color.lstrip('#'), 16)
+    r = (packed >> 16) & 0xFF
+    g = (packed >> 8) & 0xFF
+    b = packed & 0xFF
+
+    r = min(255, int(r + (255 - r) * factor))
+    g = min(255, int(g + (255 - g) * factor))
+    b = min(255, int(b + (255 - b) * factor))
+
+    return "#%06x" % ((r << 16) | (g << 8) | b)
+
+
+@lru_cache(maxsize=256)
+def _darken(color, factor):
+    packed = int(color.lstrip('#'), 16)
+    r = (packed >> 16) & 0xFF
+    g = (packed >> 8) & 0xFF
+    b = packed & 0xFF
+
+    r = max(0, int(r * (1 - factor)))
+    g = max(0, int(g * (1 - factor)))
+    b = max(0, int(b * (1 - factor)))
+
+    return "#%06x" % ((r << 16) | (g << 8) | b)
+
+
+@lru_cache(maxsize=256)
+def _rgba_hex(r, g, b, a):
+    if a < 1.0:
+        # Include alpha in hex — one packed int, one format-spec walk
+        return "#%08x" % ((r << 24) | (g << 16) | (b << 8) | int(a * 255))
+    return "#%06x" % ((r << 16) | (g << 8) | b)
+
 
 class Theme:
     """Centralized color palette and design tokens"""
@@ -64,6 +106,14 @@ class Theme:
     ANIMATION_NORMAL = 300
     ANIMATION_SLOW = 500
 
+    # Drop-shadow effects render widgets into an off-screen pixmap on
+    # every repaint — flip this off to cheapen painting on low-end machines
+    ENABLE_SHADOWS = True
+
+    # When set, animation helpers jump straight to their end state —
+    # for accessibility (reduced motion) or very low-end machines
+    REDUCED_MOTION = False
+
     # Shadow Definitions — pink glow for dark theme
     SHADOW_LIGHT = 'rgba(255, 45, 120, 0.15)'
     SHADOW_MEDIUM = 'rgba(255, 45, 120, 0.28)'
@@ -135,11 +185,7 @@ class Theme:
         Returns:
             Hex color string
         """
-        if a < 1.0:
-            # Include alpha in hex
-            alpha_hex = format(int(a * 255), '02x')
-            return f"#{format(r, '02x')}{format(g, '02x')}{format(b, '02x')}{alpha_hex}"
-        return f"#{format(r, '02x')}{format(g, '02x')}{format(b, '02x')}"
+        return _rgba_hex(r, g, b, round(a, 3))
 
     @classmethod
     def lighten_color(cls, color, factor=0.2):
@@ -153,20 +199,7 @@ class Theme:
         Returns:
             Lightened hex color string
         """
-        # Remove # if present
-        color = color.lstrip('#')
-
-        # Convert to RGB
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
-
-        # Lighten
-        r = min(255, int(r + (255 - r) * factor))
-        g = min(255, int(g + (255 - g) * factor))
-        b = min(255, int(b + (255 - b) * factor))
-
-        return f"#{format(r, '02x')}{format(g, '02x')}{format(b, '02x')}"
+        return _lighten(color, round(factor, 3))
 
     @classmethod
     def darken_color(cls, color, factor=0.2):
@@ -180,17 +213,12 @@ class Theme:
         Returns:
             Darkened hex color string
         """
-        # Remove # if present
-        color = color.lstrip('#')
-
-        # Convert to RGB
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
+        return _darken(color, round(factor, 3))
 
-        # Darken
-        r = max(0, int(r * (1 - factor)))
-        g = max(0, int(g * (1 - factor)))
-        b = max(0, int(b * (1 - factor)))
 
-        return f"#{format(r, '02x')}{format(g, '02x')}{format(b, '02x')}"
+# Derived palette tokens, folded once at import — stylesheet builders
+# read plain attributes instead of calling the color helpers at runtime
+Theme.ACCENT_HOVER = Theme.lighten_color(Theme.ACCENT, 0.3)
+Theme.ERROR_HOVER = Theme.darken_color(Theme.ERROR, 0.2)
+Theme.WARNING_SOFT = Theme.lighten_color(Theme.WARNING, 0.8)
+Theme.TEXT_DIM = Theme.darken_color(Theme.TEXT, 0.3)
@@ -1,5 +1,43 @@
+import os
+
 from PIL import Image
 
+try:
+    import piexif
+except ImportError:  # Lossless JPEG stripping is optional
+    piexif = None
+
+
+def get_exif_info_or_none(image_path):
+    """
+    Read EXIF information with a single image open.
+
+    Callers that check for EXIF and then read it should use this instead
+    of has_exif_data + get_exif_info — that pair opens and header-parses
+    the file twice.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        dict: Dictionary of EXIF tags and values, or None if the image
+        has no EXIF data or cannot be read
+    """
+    try:
+        with Image.open(image_path) as img:
+            exif_data = img.getexif()
+
+            if not exif_data:
+                return None
+
+            # Convert tag IDs to tag names where possible — bind the TAGS
+            # dict once instead of re-resolving the attribute per tag
+            tags = Image.ExifTags.TAGS
+            return {tags.get(tag_id, tag_id): value
+                    for tag_id, value in exif_data.items()}
+    except Exception:
+        return None
+
 
 def has_exif_data(image_path):
     """
@@ -11,12 +49,7 @@ def has_exif_data(image_path):
     Returns:
         bool: True if image has EXIF data, False otherwise
     """
-    try:
-        img = Image.open(image_path)
-        exif_data = img.getexif()
-        return exif_data is not None and len(exif_data) > 0
-    except Exception:
-        return False
+    return get_exif_info_or_none(image_path) is not None
 
 
 def get_exif_info(image_path):
@@ -29,20 +62,7 @@ def get_exif_info(image_path):
     Returns:
         dict: Dictionary of EXIF tags and values, or empty dict if no EXIF data
     """
-    try:
-        img = Image.open(image_path)
-        exif_data = img.getexif()
-
-        if exif_data:
-            exif_dict = {}
-            for tag_id, value in exif_data.items():
-                # Convert tag ID to tag name if possible
-                tag_name = Image.ExifTags.TAGS.get(tag_id, tag_id)
-                exif_dict[tag_name] = value
-            return exif_dict
-        return {}
-    except Exception as e:
-        return {}
+    return get_exif_info_or_none(image_path) or {}
 
 
 def strip_metadata(image_path, output_path):
@@ -57,18 +77,31 @@ def strip_metadata(image_path, output_path):
         tuple: (success: bool, message: str)
     """
     try:
-        img = Image.open(image_path)
-
-        # Get the format
-        img_format = img.format
-
-        # Create a new image without metadata
-        data = list(img.getdata())
-        image_without_exif = Image.new(img.mode, img.size)
-        image_without_exif.putdata(data)
-
-        # Save without any metadata
-        image_without_exif.save(output_path, format=img_format)
+        # JPEG: rewrite only the metadata segments — no decode, no
+        # re-encode, no generation loss
+        ext = os.path.splitext(image_path)[1].lower()
+        if piexif is not None and ext in ('.jpg', '.jpeg'):
+            piexif.remove(image_path, output_path)
+            return True, "Metadata removed successfully"
+
+        with Image.open(image_path) as img:
+            # Get the format
+            img_format = img.format
+
+            # Dropping the metadata from img.info is enough — save() only
+            # writes the ancillary chunks it finds there. The old approach
+            # round-tripped every pixel through list(getdata())/putdata(),
+            # which builds millions of Python tuples for a large photo.
+            img.load()
+            img.info.pop('exif', None)
+            img.info.pop('icc_profile', None)
+
+            save_kwargs = {'format': img_format}
+            if img_format == 'JPEG':
+                # Explicitly write an empty EXIF segment
+                save_kwargs['exif'] = b''
+
+            img.save(output_path, **save_kwargs)
 
         return True, "Metadata removed successfully"
     except Exception as e: